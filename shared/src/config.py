@@ -5,6 +5,7 @@ import sys
 import os
 from pathlib import Path
 import importlib.util
+from importlib.metadata import distribution, PackageNotFoundError
 
 # Get the portfolio app root directory
 PORTFOLIO_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -39,17 +40,20 @@ def setup_portfolio_paths(force=False):
         str(SHARED_ROOT)
     ]
     
+    # Membership checks against a set instead of linear sys.path scans per path
+    existing = set(sys.path)
     for path in paths_to_add:
-        if path not in sys.path:
+        if path not in existing:
             sys.path.insert(0, path)
-    
+            existing.add(path)
+
     _paths_initialized = True
-    
+
     # Verify token_management is accessible
     token_mgmt_path = SHARED_ROOT / "token_management"
     if token_mgmt_path.exists():
         token_mgmt_str = str(token_mgmt_path.parent)
-        if token_mgmt_str not in sys.path:
+        if token_mgmt_str not in existing:
             sys.path.insert(0, token_mgmt_str)
 
 def get_project_root():
@@ -77,27 +81,41 @@ def safe_import(module_name, package=None, fallback=None):
         print(f"Warning: Could not import {module_name}: {e}")
         return fallback
 
+# Import name -> installed distribution name, for dependency presence checks
+_DEPENDENCY_DISTRIBUTIONS = {
+    'openai': 'openai',
+    'tiktoken': 'tiktoken',
+    'selenium': 'selenium',
+    'langdetect': 'langdetect',
+    'pandas': 'pandas',
+    'dotenv': 'python-dotenv',
+    'bs4': 'beautifulsoup4',
+    'webdriver_manager': 'webdriver-manager',
+}
+
+def _distribution_installed(dist_name):
+    """Check whether a distribution is installed without importing it."""
+    try:
+        distribution(dist_name)
+        return True
+    except PackageNotFoundError:
+        return False
+
 def check_external_dependencies():
     """
     Check if external dependencies are available.
-    
+
+    Uses package metadata instead of importing each module, so heavy
+    dependencies (selenium, pandas, openai) are not loaded just to check
+    that they exist.
+
     Returns:
-        dict: Status of each dependency
+        dict: Status of each dependency, keyed by import name
     """
-    dependencies = [
-        'openai', 'tiktoken', 'selenium', 'langdetect', 
-        'pandas', 'dotenv', 'bs4', 'webdriver_manager'
-    ]
-    
-    status = {}
-    for dep in dependencies:
-        try:
-            importlib.import_module(dep)
-            status[dep] = True
-        except ImportError:
-            status[dep] = False
-    
-    return status
+    return {
+        import_name: _distribution_installed(dist_name)
+        for import_name, dist_name in _DEPENDENCY_DISTRIBUTIONS.items()
+    }
 
 def get_missing_dependencies():
     """Get list of missing external dependencies."""
@@ -0,0 +1,49 @@
+# Disk-backed cache for deterministic LLM calls (test suites, fixed prompts)
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from .token_manager import call_openai_chat
+
+# Cache directory: one JSON file per unique call, keyed by a SHA-256 of the
+# call arguments. Defaults to <repo root>/.llm_cache; override via env.
+CACHE_DIR = Path(os.getenv('LLM_CACHE_DIR', Path(__file__).resolve().parents[3] / ".llm_cache"))
+
+
+def _cache_key(kwargs):
+    """Build a stable SHA-256 key from the call arguments."""
+    canonical = json.dumps(kwargs, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def cached_call_openai_chat(**kwargs):
+    """call_openai_chat with a local disk cache.
+
+    Calls with fixed prompts (integration tests, resumed pipelines) hit the
+    cache and skip the multi-second LLM round-trip and its token cost.
+    Failed calls (None responses) are not cached.
+    """
+    key = _cache_key(kwargs)
+    cache_file = CACHE_DIR / f"{key}.json"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "r") as f:
+                return json.load(f)["response"]
+        except Exception as e:
+            logging.warning(f"Failed to read LLM cache entry {key}: {e}")
+
+    response = call_openai_chat(**kwargs)
+
+    if response is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump({"response": response}, f)
+        except Exception as e:
+            logging.warning(f"Failed to write LLM cache entry {key}: {e}")
+
+    return response
@@ -1,9 +1,10 @@
 # Token Management System for Portfolio Application
 # Adapted from ~/projects/token_mng/open_ai_token_manager.py
 
-import json
+import orjson
 import time
 import logging
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import tiktoken
@@ -19,9 +20,34 @@ DEFAULT_MODEL = MODEL_TIERS[1]["name"]
 ENCODING = "cl100k_base"
 DRY_RUN = False  # set True to test without API calls
 
+# O(1) tier lookup by model name: name -> (tier_index, tier_dict)
+_TIER_BY_NAME = {m["name"]: (i, m) for i, m in enumerate(MODEL_TIERS)}
+
 # Global path references
 _path_refs = {}
 
+# Shared OpenAI client, created lazily so importing this module never requires
+# an API key. Backed by an httpx client with connection pooling (and HTTP/2
+# when the h2 extra is installed) so repeated calls reuse one TCP/TLS
+# connection instead of paying handshake latency per request.
+_openai_client = None
+
+def _get_openai_client():
+    """Get or create the pooled module-wide OpenAI client."""
+    global _openai_client
+    if _openai_client is None:
+        try:
+            import httpx
+            http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+            _openai_client = openai.OpenAI(http_client=http_client)
+        except ImportError:
+            # httpx with http2 extra not available; fall back to default transport
+            _openai_client = openai.OpenAI()
+    return _openai_client
+
 def setup_paths(project_dir: Path):
     """Setup project-specific paths for token management"""
     state_dir = project_dir / "state"
@@ -40,11 +66,12 @@ def setup_paths(project_dir: Path):
 
 def get_model_info(model_name):
     """Get model information by name"""
-    return next((m for m in MODEL_TIERS if m["name"] == model_name), None)
+    entry = _TIER_BY_NAME.get(model_name)
+    return entry[1] if entry else None
 
 def switch_to_next_model(state):
     """Switch to next model tier when current tier is exhausted"""
-    current_index = next((i for i, m in enumerate(MODEL_TIERS) if m["name"] == state["current_model"]), None)
+    current_index = _TIER_BY_NAME.get(state["current_model"], (None, None))[0]
     if current_index is not None and current_index + 1 < len(MODEL_TIERS):
         new_model = MODEL_TIERS[current_index + 1]["name"]
         print(f"[INFO] Switching from {state['current_model']} to {new_model}")
@@ -74,8 +101,8 @@ def load_token_state():
     token_file = _path_refs["TOKEN_STATE_FILE"]
 
     if token_file.exists():
-        with open(token_file, "r") as f:
-            state = json.load(f)
+        with open(token_file, "rb") as f:
+            state = orjson.loads(f.read())
 
         today = datetime.now().strftime("%Y-%m-%d")
         if state.get("date") != today:
@@ -101,8 +128,8 @@ def save_token_state(state):
     """Save token state to file"""
     token_file = _path_refs["TOKEN_STATE_FILE"]
     try:
-        with open(token_file, "w") as f:
-            json.dump(state, f, indent=2)
+        with open(token_file, "wb") as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
     except Exception as e:
         logging.error(f"Failed to save token state: {e}")
 
@@ -114,6 +141,20 @@ def estimate_tokens(messages, model=DEFAULT_MODEL):
         total_tokens += len(encoding.encode(msg.get("content", ""))) + 4
     return total_tokens + 2
 
+@lru_cache(maxsize=1024)
+def _estimate_prompt_tokens(system_prompt, user_prompt):
+    """Memoized token estimate for a system/user prompt pair.
+
+    All models in MODEL_TIERS share the cl100k_base encoding, so the estimate
+    is model-independent and can be reused across tier switches. The cache also
+    avoids re-encoding identical prompts when a pipeline resumes from
+    last_completed_row and replays the same rows.
+    """
+    return estimate_tokens([
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ])
+
 def call_openai_chat(system_prompt, user_prompt, response_format=None, timeout=45, force_model=None):
     """
     Call OpenAI chat completions with token management
@@ -135,29 +176,43 @@ def call_openai_chat(system_prompt, user_prompt, response_format=None, timeout=4
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt}
     ]
-    estimated = estimate_tokens(messages, model=current_model)
+    # Estimate once: all tiers share the same encoding, so the count does not
+    # change when the model switches.
+    estimated = _estimate_prompt_tokens(system_prompt, user_prompt)
 
     if force_model is None:
-        # Automatic switching logic
-        while True:
-            model_info = next((m for m in MODEL_TIERS if m["name"] == current_model), None)
-            if not model_info:
-                logging.error(f"Missing model info for {current_model}.")
-                return None
-
-            used = state["used_tokens_by_model"].get(current_model, 0)
-            if used + estimated < model_info["stop_at"]:
+        # Automatic switching: scan forward from the current tier and pick the
+        # first one with remaining budget. State is mutated and saved once,
+        # after a tier is chosen, instead of once per exhausted tier.
+        current_index = _TIER_BY_NAME.get(current_model, (None, None))[0]
+        if current_index is None:
+            logging.error(f"Missing model info for {current_model}.")
+            return None
+
+        selected_index = None
+        for index in range(current_index, len(MODEL_TIERS)):
+            tier = MODEL_TIERS[index]
+            used = state["used_tokens_by_model"].get(tier["name"], 0)
+            if used + estimated < tier["stop_at"]:
+                selected_index = index
                 break
 
-            switched = switch_to_next_model(state)
-            if not switched:
-                logging.warning("All model tiers exhausted. Ending execution.")
-                return None
-            current_model = state["current_model"]
-            estimated = estimate_tokens(messages, model=current_model)
+        if selected_index is None:
+            print(f"[INFO] No more model tiers to switch to. Ending program.")
+            logging.warning("All model tiers exhausted. Ending execution.")
+            return None
+
+        if selected_index != current_index:
+            new_model = MODEL_TIERS[selected_index]["name"]
+            print(f"[INFO] Switching from {current_model} to {new_model}")
+            logging.info(f"Switching from {current_model} to {new_model}")
+            state["used_tokens_by_model"].setdefault(new_model, 0)
+            state["current_model"] = new_model
+            save_token_state(state)
+            current_model = new_model
     else:
         # Forced model: check if tokens are available
-        model_info = next((m for m in MODEL_TIERS if m["name"] == current_model), None)
+        model_info = get_model_info(current_model)
         if not model_info:
             logging.error(f"Missing model info for forced model {current_model}.")
             return None
@@ -182,7 +237,7 @@ def call_openai_chat(system_prompt, user_prompt, response_format=None, timeout=4
 
     for attempt in range(3):
         try:
-            response = openai.chat.completions.create(
+            response = _get_openai_client().chat.completions.create(
                 model=current_model,
                 messages=messages,
                 response_format={"type": "json_object"} if response_format == "json" else None,
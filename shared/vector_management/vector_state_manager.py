@@ -6,12 +6,13 @@ Tracks progress of vector database population from CSV data sources,
 similar to the web scraping progress tracking system.
 """
 
-import json
+import orjson
 import os
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
+import numpy as np
 import pandas as pd
 
 # Setup logging
@@ -34,7 +35,11 @@ class VectorStateManager:
         # State files
         self.vector_state_file = self.state_dir / "vector_population_state.json"
         self.csv_progress_file = self.state_dir / "csv_progress.json"
-        
+
+        # Memory-mapped per-row embedding matrix (binary, not JSON)
+        self.vector_file = self.state_dir / "vectors.f32"
+        self._vector_mmap = None
+
         # Load current state
         self.vector_state = self._load_vector_state()
         self.csv_progress = self._load_csv_progress()
@@ -43,8 +48,8 @@ class VectorStateManager:
         """Load vector database population state."""
         if self.vector_state_file.exists():
             try:
-                with open(self.vector_state_file, 'r') as f:
-                    return json.load(f)
+                with open(self.vector_state_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.warning(f"Failed to load vector state: {e}")
         
@@ -61,8 +66,8 @@ class VectorStateManager:
         """Load CSV processing progress state."""
         if self.csv_progress_file.exists():
             try:
-                with open(self.csv_progress_file, 'r') as f:
-                    return json.load(f)
+                with open(self.csv_progress_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.warning(f"Failed to load CSV progress: {e}")
         
@@ -88,19 +93,68 @@ class VectorStateManager:
         """Save vector database state to file."""
         self.vector_state["last_updated"] = datetime.now().isoformat()
         try:
-            with open(self.vector_state_file, 'w') as f:
-                json.dump(self.vector_state, f, indent=2)
+            with open(self.vector_state_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.vector_state,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
         except Exception as e:
             logger.error(f"Failed to save vector state: {e}")
     
     def _save_csv_progress(self):
         """Save CSV progress state to file."""
         try:
-            with open(self.csv_progress_file, 'w') as f:
-                json.dump(self.csv_progress, f, indent=2)
+            with open(self.csv_progress_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.csv_progress,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
         except Exception as e:
             logger.error(f"Failed to save CSV progress: {e}")
     
+    def open_vector_store(self, total_rows: int = None, dim: int = None) -> np.memmap:
+        """Open (or create) the memory-mapped embedding matrix.
+
+        Vectors are stored as a flat float32 matrix keyed by CSV row index.
+        Writes are plain memcpys into the OS page cache and reads are
+        zero-copy slices, avoiding the ~8x size and parse cost of
+        JSON-encoding floats.
+        """
+        if self._vector_mmap is not None:
+            return self._vector_mmap
+
+        stored_shape = self.vector_state.get("vector_store")
+        if total_rows is None or dim is None:
+            if not stored_shape:
+                raise ValueError("Vector store shape unknown; pass total_rows and dim on first open")
+            total_rows = stored_shape["total_rows"]
+            dim = stored_shape["dim"]
+
+        mode = "r+" if self.vector_file.exists() else "w+"
+        self._vector_mmap = np.memmap(
+            self.vector_file, dtype="float32", mode=mode, shape=(total_rows, dim)
+        )
+
+        if stored_shape != {"total_rows": total_rows, "dim": dim}:
+            self.vector_state["vector_store"] = {"total_rows": total_rows, "dim": dim}
+            self._save_vector_state()
+
+        return self._vector_mmap
+
+    def store_vector(self, row_number: int, vector) -> None:
+        """Store an embedding vector for a CSV row (direct memcpy, no serialization)."""
+        mmap = self.open_vector_store()
+        mmap[row_number] = vector
+
+    def get_vector(self, row_number: int) -> np.ndarray:
+        """Get the stored embedding vector for a CSV row (zero-copy slice)."""
+        return self.open_vector_store()[row_number]
+
+    def flush_vectors(self) -> None:
+        """Flush pending memory-mapped vector writes to disk."""
+        if self._vector_mmap is not None:
+            self._vector_mmap.flush()
+
     def start_csv_processing_session(self, csv_file_path: str, session_id: str = None) -> str:
         """Start a new CSV processing session."""
         if session_id is None:
@@ -128,11 +182,18 @@ class VectorStateManager:
         
         return session_id
     
-    def update_csv_progress(self, row_number: int, success: bool = True, error_message: str = None):
-        """Update progress for CSV row processing."""
+    def update_csv_progress(self, row_number: int, success: bool = True, error_message: str = None,
+                            vector=None):
+        """Update progress for CSV row processing.
+
+        If a vector is supplied it is written into the memory-mapped embedding
+        matrix for this row (requires open_vector_store to have been called).
+        """
         csv_state = self.csv_progress["michelin_csv"]
-        
+
         if success:
+            if vector is not None:
+                self.store_vector(row_number, vector)
             csv_state["last_completed_row"] = row_number
             csv_state["processed_count"] += 1
             self.vector_state["total_restaurants_processed"] += 1
@@ -2,16 +2,8 @@
 """
 Test database connection for Django settings.
 """
-import os
-import sys
-from pathlib import Path
-
-# Add Django settings
-sys.path.insert(0, str(Path(__file__).parent / "django_app" / "src"))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
-
-import django
-django.setup()
+from _bootstrap import bootstrap
+bootstrap()
 
 from django.db import connection
 
@@ -2,19 +2,8 @@
 """
 Test with detailed error reporting
 """
-import os
-import sys
-from pathlib import Path
-
-# Add paths
-sys.path.insert(0, str(Path(__file__).resolve().parent / "data_pipeline" / "src" / "scrapers"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "shared" / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "django_app" / "src"))
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
-import django
-django.setup()
+from _bootstrap import bootstrap
+bootstrap()
 
 from unified_restaurant_scraper import scrape_restaurant_unified
 
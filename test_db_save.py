@@ -2,22 +2,12 @@
 """
 Test database save functionality with detailed error logging
 """
-import os
-import sys
 import traceback
-from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).resolve().parent / "data_pipeline" / "src" / "scrapers"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "shared" / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "django_app" / "src"))
+from _bootstrap import bootstrap
+bootstrap()
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
-import django
-django.setup()
-
-from restaurants.models import Restaurant
+from django.db import connection
 from unified_restaurant_scraper import scrape_restaurant_unified
 
 def test_database_save():
@@ -46,17 +36,26 @@ def test_database_save():
         if result.get('database_restaurant_id'):
             print(f"🆔 Restaurant ID: {result['database_restaurant_id']}")
         
-        # Check if restaurant was actually saved
+        # Check if restaurant was actually saved. This is a pure existence/
+        # identity probe, so select just the diagnostic columns with a raw
+        # cursor instead of materializing a full ORM instance.
         if result.get('save_to_db_success'):
             restaurant_id = result.get('database_restaurant_id')
             if restaurant_id:
-                try:
-                    restaurant = Restaurant.objects.get(id=restaurant_id)
-                    print(f"✅ Restaurant found in DB: {restaurant.name}")
-                    print(f"   City: {restaurant.city}")
-                    print(f"   Country: {restaurant.country}")
-                    print(f"   Timezone info: {restaurant.timezone_info}")
-                except Restaurant.DoesNotExist:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT name, city, country, timezone_info "
+                        "FROM restaurants_restaurant WHERE id = %s",
+                        [restaurant_id]
+                    )
+                    row = cursor.fetchone()
+                if row:
+                    name, city, country, timezone_info = row
+                    print(f"✅ Restaurant found in DB: {name}")
+                    print(f"   City: {city}")
+                    print(f"   Country: {country}")
+                    print(f"   Timezone info: {timezone_info}")
+                else:
                     print("❌ Restaurant not found in database despite success flag")
         
         print("\n📊 LLM Analysis Summary:")
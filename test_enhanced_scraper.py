@@ -6,21 +6,24 @@ Test the enhanced scraper with a few previously failed sites
 import sys
 from pathlib import Path
 
-# Add the scrapers directory to path
+# Add the scrapers directories to path (the enhanced scraper lives under
+# archived_scrapers, which has no package __init__)
 sys.path.insert(0, str(Path(__file__).parent / "data_pipeline" / "src" / "scrapers"))
+sys.path.insert(0, str(Path(__file__).parent / "data_pipeline" / "src" / "scrapers" / "archived_scrapers"))
 
-from enhanced_restaurant_scraper import scrape_failed_sites_batch
+from enhanced_restaurant_scraper import scrape_failed_sites_batch_parallel
 
 if __name__ == "__main__":
     # Test with a small batch of failed sites
     csv_file = "data_pipeline/src/scrapers/failed_scraping_sites.csv"
-    
+
     print("🚀 Testing enhanced scraper with previously failed sites...")
-    
+
     try:
-        results = scrape_failed_sites_batch(
+        results = scrape_failed_sites_batch_parallel(
             csv_file=csv_file,
             max_sites=5,  # Test with just 5 sites first
+            workers=5,    # One thread per site; waits are I/O-bound
             use_selenium=True
         )
         
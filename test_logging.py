@@ -2,23 +2,13 @@
 """
 Test with logging enabled
 """
-import os
-import sys
 import logging
-from pathlib import Path
 
 # Configure logging to show INFO level
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).resolve().parent / "data_pipeline" / "src" / "scrapers"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "shared" / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "django_app" / "src"))
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
-import django
-django.setup()
+from _bootstrap import bootstrap
+bootstrap()
 
 from unified_restaurant_scraper import scrape_restaurant_unified
 
@@ -3,18 +3,9 @@
 Test restaurant summary functionality
 """
 import os
-import sys
-from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).resolve().parent / "data_pipeline" / "src" / "scrapers"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "shared" / "src"))
-sys.path.insert(0, str(Path(__file__).resolve().parent / "django_app" / "src"))
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
-import django
-django.setup()
+from _bootstrap import bootstrap
+bootstrap()
 
 try:
     from templates import get_summary_prompt, summary_prompt
@@ -23,11 +14,16 @@ except ImportError as e:
     print(f"❌ Templates import failed: {e}")
 
 try:
-    from token_management.token_manager import call_openai_chat
+    from token_management.llm_cache import cached_call_openai_chat
     print("✅ Token manager imported successfully")
 except ImportError as e:
     print(f"❌ Token manager import failed: {e}")
 
+# FAST_TESTS=1 short-circuits the live LLM call with a canned response so
+# CI runs verify the plumbing without paying network latency.
+if os.getenv('FAST_TESTS'):
+    cached_call_openai_chat = lambda **kwargs: '{"ok": true}'
+
 # Test basic summary
 def test_summary():
     print("\n🧪 Testing restaurant summary...")
@@ -44,8 +40,8 @@ def test_summary():
         user_prompt = get_summary_prompt(test_url, test_content)
         print(f"✅ User prompt generated: {len(user_prompt)} chars")
         
-        # Test call_openai_chat directly
-        response = call_openai_chat(
+        # Fixed prompt: cached on disk, so repeat runs skip the LLM round-trip
+        response = cached_call_openai_chat(
             system_prompt=summary_prompt,
             user_prompt=user_prompt,
             force_model="gpt-4o-mini",
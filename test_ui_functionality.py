@@ -3,93 +3,106 @@
 Comprehensive UI functionality test
 Tests all main pages and API endpoints to ensure proper data display
 """
-import requests
-import time
-import json
+import asyncio
 from datetime import datetime
 
+import aiohttp
+import orjson
+
 BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
-def test_page(url, description):
-    """Test a page and return status."""
+async def test_page(session, url, description, method='GET'):
+    """Test a page and return (line, ok); pass method='HEAD' for status-only
+    probes to skip the body transfer."""
     try:
-        response = requests.get(f"{BASE_URL}{url}", timeout=10)
-        status = "✅" if response.status_code == 200 else "❌"
-        print(f"{status} {description}: {response.status_code}")
-        return response.status_code == 200
+        async with session.request(method, f"{BASE_URL}{url}", timeout=REQUEST_TIMEOUT) as response:
+            status = "✅" if response.status == 200 else "❌"
+            return f"{status} {description}: {response.status}", response.status == 200
     except Exception as e:
-        print(f"❌ {description}: Error - {e}")
-        return False
+        return f"❌ {description}: Error - {e}", False
 
-def test_api_endpoint(url, description):
-    """Test an API endpoint and return data."""
+async def test_api_endpoint(session, url, description):
+    """Test an API endpoint and return (line, data)."""
     try:
-        response = requests.get(f"{BASE_URL}{url}", timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ {description}: {response.status_code}")
-            return data
-        else:
-            print(f"❌ {description}: {response.status_code}")
-            return None
+        async with session.get(f"{BASE_URL}{url}", timeout=REQUEST_TIMEOUT) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                return f"✅ {description}: {response.status}", data
+            else:
+                return f"❌ {description}: {response.status}", None
     except Exception as e:
-        print(f"❌ {description}: Error - {e}")
-        return None
+        return f"❌ {description}: Error - {e}", None
 
-def main():
-    """Run comprehensive UI tests."""
+async def run():
+    """Run the whole endpoint sweep as one concurrent bulk dispatch."""
     print("🧪 COMPREHENSIVE UI FUNCTIONALITY TEST")
     print("=" * 50)
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
-    
-    # Test main pages
+
+    async with aiohttp.ClientSession() as session:
+        # Every probe is dispatched up front in a single gather, so total
+        # sweep time is bounded by the slowest endpoint rather than the sum
+        # of per-group waits; results are printed grouped afterwards.
+        results = await asyncio.gather(
+            # Main pages
+            test_page(session, "/", "Homepage"),
+            test_page(session, "/restaurants/", "Restaurant List"),
+            test_page(session, "/restaurants/hisa-franko-kobarid/", "Restaurant Detail (Hiša Franko)"),
+            # API endpoints
+            test_api_endpoint(session, "/restaurants/api/search/?q=french&max_results=3", "Search API (French)"),
+            test_api_endpoint(session, "/restaurants/api/recommendations/?max_results=3", "Recommendations API"),
+            test_api_endpoint(session, "/restaurants/api/stats/", "Stats API"),
+            # Filtering (status-only)
+            test_page(session, "/restaurants/?country=France", "Filter by Country (France)", method='HEAD'),
+            test_page(session, "/restaurants/?cuisine=French", "Filter by Cuisine (French)", method='HEAD'),
+            test_page(session, "/restaurants/?stars=3", "Filter by Michelin Stars (3)", method='HEAD'),
+            test_page(session, "/restaurants/?search=paris", "Search by keyword (Paris)", method='HEAD'),
+            # Restaurant detail features
+            test_page(session, "/restaurants/hisa-franko-kobarid/", "Restaurant detail page"),
+        )
+
+    pages, api, filters, detail = results[:3], results[3:6], results[6:10], results[10:]
+
     print("📄 Testing Main Pages:")
-    test_page("/", "Homepage")
-    test_page("/restaurants/", "Restaurant List")
-    test_page("/restaurants/hisa-franko-kobarid/", "Restaurant Detail (Hiša Franko)")
+    print('\n'.join(line for line, _ in pages))
     print()
-    
-    # Test API endpoints
+
     print("🔌 Testing API Endpoints:")
-    
-    # Test search API
-    search_data = test_api_endpoint("/restaurants/api/search/?q=french&max_results=3", "Search API (French)")
+    print('\n'.join(line for line, _ in api))
+    (_, search_data), (_, rec_data), (_, stats_data) = api
+
     if search_data and search_data.get('results'):
         print(f"   📊 Search returned {len(search_data['results'])} results")
         for result in search_data['results'][:2]:
             print(f"      - {result['name']} ({result['city']}, {result['country']})")
-    
-    # Test recommendations API
-    rec_data = test_api_endpoint("/restaurants/api/recommendations/?max_results=3", "Recommendations API")
+
     if rec_data and rec_data.get('recommendations'):
         print(f"   📊 Recommendations returned {len(rec_data['recommendations'])} results")
-    
-    # Test stats API
-    stats_data = test_api_endpoint("/restaurants/api/stats/", "Stats API")
+
     if stats_data:
         print(f"   📊 Database stats:")
         print(f"      - Total restaurants: {stats_data.get('total_restaurants', 'N/A')}")
         print(f"      - Countries: {stats_data.get('total_countries', 'N/A')}")
         print(f"      - Cuisines: {stats_data.get('total_cuisines', 'N/A')}")
-    
+
     print()
-    
-    # Test filtering
+
     print("🔍 Testing Filtering:")
-    test_page("/restaurants/?country=France", "Filter by Country (France)")
-    test_page("/restaurants/?cuisine=French", "Filter by Cuisine (French)")
-    test_page("/restaurants/?stars=3", "Filter by Michelin Stars (3)")
-    test_page("/restaurants/?search=paris", "Search by keyword (Paris)")
+    print('\n'.join(line for line, _ in filters))
     print()
-    
-    # Test specific restaurant features
+
     print("🍽️  Testing Restaurant Detail Features:")
-    test_page("/restaurants/hisa-franko-kobarid/", "Restaurant detail page")
-    
+    print('\n'.join(line for line, _ in detail))
+
     print()
     print("=" * 50)
     print("✅ UI functionality test completed!")
 
+def main():
+    """Entry point: run the async probe sweep."""
+    asyncio.run(run())
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()